@@ -33,6 +33,27 @@ class TestCurrentProcessWithCheckGarbage(object):
         exe.baseaddr == exe_by_module.baseaddr
         exe.bitness ==  exe_by_module.bitness
 
+    def test_peb_modules_by_name_and_base(self):
+        peb = windows.current_process.peb
+        k32 = peb.modules_by_name["kernel32.dll"]
+        assert k32.name == "kernel32.dll"
+        assert peb.modules_by_base[k32.baseaddr].name == "kernel32.dll"
+        # Indexes are cached until explicitly invalidated
+        cached = peb.modules_by_name
+        assert peb.modules_by_name is cached
+        peb.invalidate_modules_cache()
+        assert peb.modules_by_name is not cached
+
+    def test_peb_modules_snapshot(self):
+        peb = windows.current_process.peb
+        snap = peb.modules_snapshot
+        assert len(snap.bases) == len(snap.sizes) == len(snap.names)
+        assert list(snap.bases) == sorted(snap.bases)
+        k32 = peb.modules_by_name["kernel32.dll"]
+        assert peb.module_containing(k32.baseaddr) == "kernel32.dll"
+        assert peb.module_containing(k32.baseaddr + k32.SizeOfImage - 1) == "kernel32.dll"
+        assert peb.module_containing(0) is None
+
     def test_current_process_pe_imports(self):
         python_module = windows.current_process.peb.modules[0]
         imp = python_module.pe.imports
@@ -92,6 +113,52 @@ class TestProcessWithCheckGarbage(object):
             proc32_64.write_memory(k32.baseaddr, "XD")
         assert proc32_64.read_memory(k32.baseaddr, 2) ==  "XD"
 
+    def test_read_batch(self, proc32_64):
+        with proc32_64.allocated_memory(0x3000) as addr:
+            proc32_64.write_memory(addr, "AAAA")
+            # Within the default gap of the first range: coalesced
+            proc32_64.write_memory(addr + 0x800, "BBBB")
+            # Beyond the gap: read separately
+            proc32_64.write_memory(addr + 0x2800, "CCCC")
+            ranges = [(addr + 0x800, 4), (addr, 4), (addr + 0x2800, 4)]
+            res = proc32_64.read_batch(ranges)
+            assert res == {r_addr: proc32_64.read_memory(r_addr, r_size) for r_addr, r_size in ranges}
+            assert res[addr] == "AAAA"
+            assert res[addr + 0x800] == "BBBB"
+            assert res[addr + 0x2800] == "CCCC"
+
+    def test_memory_cache_read(self, proc32_64):
+        k32 = [m for m in proc32_64.peb.modules if m.name == "kernel32.dll"][0]
+        uncached = proc32_64.read_memory(k32.baseaddr, 0x2000)
+        proc32_64.enable_memory_cache()
+        try:
+            assert proc32_64.read_memory(k32.baseaddr, 0x2000) == uncached
+            # Second read is served from the cache
+            assert proc32_64.read_memory(k32.baseaddr, 0x2000) == uncached
+        finally:
+            proc32_64.disable_memory_cache()
+
+    def test_memory_cache_read_page_boundary(self, proc32_64):
+        with proc32_64.allocated_memory(0x2000) as addr:
+            proc32_64.write_memory(addr + 0xffc, "ABCDEFGH")
+            proc32_64.enable_memory_cache()
+            try:
+                assert proc32_64.read_memory(addr + 0xffc, 8) == "ABCDEFGH"
+            finally:
+                proc32_64.disable_memory_cache()
+
+    def test_memory_cache_write_invalidation(self, proc32_64):
+        with proc32_64.allocated_memory(0x1000) as addr:
+            proc32_64.write_memory(addr, "AAAA")
+            proc32_64.enable_memory_cache()
+            try:
+                # Populate the cached page, then write_memory must drop it
+                assert proc32_64.read_memory(addr, 4) == "AAAA"
+                proc32_64.write_memory(addr, "BBBB")
+                assert proc32_64.read_memory(addr, 4) == "BBBB"
+            finally:
+                proc32_64.disable_memory_cache()
+
     def test_read_string(self, proc32_64):
         test_string = "TEST_STRING"
         string_to_write = test_string + "\x00"
@@ -181,6 +248,16 @@ class TestProcessWithCheckGarbage(object):
                 assert len(proc.threads) ==  1
 
 
+    def test_map_shared_memory(self, proc32_64):
+        local_addr, remote_addr = proc32_64.map_shared_memory(0x1000)
+        # Bytes written through the local view must be visible in the
+        # target without any write_memory
+        windows.current_process.write_memory(local_addr, "SHARED")
+        assert proc32_64.read_memory(remote_addr, 6) == "SHARED"
+        # And both ways: the target writes, the local view sees it
+        proc32_64.write_memory(remote_addr, "DERAHS")
+        assert windows.current_process.read_memory(local_addr, 6) == "DERAHS"
+
     # Remote structure parsing
 
     def test_parse_remote_peb(self, proc32_64):
@@ -306,11 +383,52 @@ class TestProcessWithCheckGarbage(object):
         assert t.exit_code == 0x11223344
 
 
+    def test_thread_context_type(self, proc32):
+        code = x86.MultipleInstr()
+        code += x86.Mov("EAX", 0x42424242)
+        code += x86.Label(":LOOP")
+        code += x86.Jmp(":LOOP")
+        t = proc32.execute(code.get_code())
+        time.sleep(0.5)
+        ctx = t.context
+        if windows.current_process.bitness == 64:
+            assert isinstance(ctx, windows.winobject.exception.ECONTEXTWOW64)
+        else:
+            assert isinstance(ctx, windows.winobject.exception.ECONTEXT32)
+        assert ctx.ContextFlags
+        assert ctx.Eax == 0x42424242
+
+    def test_thread_context_into_reuse(self, proc32):
+        code = x86.MultipleInstr()
+        code += x86.Mov("EAX", 0x42424242)
+        code += x86.Label(":LOOP")
+        code += x86.Jmp(":LOOP")
+        t = proc32.execute(code.get_code())
+        time.sleep(0.5)
+        ctx = t.context
+        assert ctx.Eax == 0x42424242
+        # context_into must refill the same object in place
+        ctx.Eax = 0
+        assert t.context_into(ctx) is ctx
+        assert ctx.Eax == 0x42424242
+
     def test_load_library(self, proc32_64):
         DLL = "wintrust.dll"
         proc32_64.load_library(DLL)
         assert DLL in [m.name for m in proc32_64.peb.modules]
 
+    def test_peb_modules_cached(self, proc32_64):
+        peb = proc32_64.peb
+        first = peb.modules_cached
+        assert [m.name for m in first] == [m.name for m in peb.modules]
+        # Unchanged LDR list: the probe must hand back the cached list itself
+        assert peb.modules_cached is first
+        proc32_64.load_library("wintrust.dll")
+        # The load relinked the list: the probe must trigger a re-walk
+        assert "wintrust.dll" in [m.name for m in peb.modules_cached]
+        peb.invalidate_modules_cache()
+        assert peb.modules_cached is not first
+
     def test_load_library_unicode_name(self, proc32_64, tmpdir):
         mybitness = windows.current_process.bitness
         UNICODE_FILENAME = u'\u4e2d\u56fd\u94f6\u884c\u7f51\u94f6\u52a9\u624b.dll'
@@ -45,5 +45,15 @@ class TestSystemWithCheckGarbageAndHandleLeak(object):
         procs = windows.system.processes
         assert windows.current_process.pid in [p.pid for p in procs]
 
+    def test_pids(self):
+        pids = windows.system.pids
+        assert windows.current_process.pid in pids
+
+    def test_processes_by_pid(self):
+        procs_by_pid = windows.system.processes_by_pid
+        myself = procs_by_pid[windows.current_process.pid]
+        assert myself.pid == windows.current_process.pid
+        assert myself.ppid == windows.current_process.ppid
+
     def test_system_modules(self):
         return windows.system.modules
\ No newline at end of file
@@ -4043,8 +4043,9 @@ class _LSA_UNICODE_STRING(INITIAL_LSA_UNICODE_STRING):
         if getattr(self, "_target", None) is not None: #remote ctypes :D -> TRICKS OF THE YEAR
             raw_data = self._target.read_memory(self.Buffer, self.Length)
             return raw_data.decode("utf16")
-        size = self.Length / 2
-        return (ctypes.c_wchar * size).from_address(self.Buffer)[:]
+        # wstring_at extracts the unicode in one C call, where building a
+        # (c_wchar * size) type per call paid the array-metaclass + a slice
+        return ctypes.wstring_at(self.Buffer, self.Length / 2)
 
     @classmethod
     def from_string(cls, s):
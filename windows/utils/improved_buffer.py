@@ -22,10 +22,12 @@ class ImprovedCtypesBufferBase(object):
         return ctypes.cast(self, type)
 
     def as_string(self):
-        return ctypes.cast(self, gdef.LPCSTR).value
+        # string_at reads the NUL-terminated string directly, without the
+        # intermediate pointer object ctypes.cast would allocate
+        return ctypes.string_at(ctypes.addressof(self))
 
     def as_wstring(self):
-        return ctypes.cast(self, gdef.LPWSTR).value
+        return ctypes.wstring_at(ctypes.addressof(self))
 
     def as_pvoid(self):
         return self.cast(gdef.PVOID)
@@ -53,6 +55,11 @@ class ImprovedCtypesBufferBase(object):
         return super(ImprovedCtypesBufferBase, cls).__new__(cls, *args, **kwargs)
 
 
+# Generated array types are cached: creating a ctypes.Array subclass goes
+# through the full metaclass machinery, which is expensive to redo for every
+# buffer of an already-seen (type, nbelt)
+_GENERATED_BUFFER_TYPES = {}
+
 # Used in windows.crypto.sign_verify for test
 class PartialBufferType(object):
     def __init__(self, type, nbelt=None):
@@ -64,6 +71,10 @@ class PartialBufferType(object):
         if isinstance(nbelt, long):
             nbelt = int(nbelt)
             assert isinstance(nbelt, int)
+        try:
+            return _GENERATED_BUFFER_TYPES[(item_type, nbelt)]
+        except KeyError:
+            pass
         cls_name = "TypedBuffer<{0}><{1}>".format(item_type.__name__, nbelt)
 
         class TmpImplemArrayName(ImprovedCtypesBufferBase, ctypes.Array):
@@ -71,6 +82,7 @@ class PartialBufferType(object):
             _length_ = nbelt
 
         TmpImplemArrayName.__name__ = cls_name
+        _GENERATED_BUFFER_TYPES[(item_type, nbelt)] = TmpImplemArrayName
         return TmpImplemArrayName
 
     def from_buffer(self, buffer): # size as kwargs ?
@@ -9,61 +9,119 @@ from windows import winproxy
 
 
 
-def fixedpropety(f):
-    cache_name = "_" + f.__name__
-
-    def prop(self):
+class fixedpropety(object):
+    """A property computed once then cached in the instance ``__dict__``.
+
+    The cache lives under ``"_" + name`` so subclasses can still pre-seed it
+    (``self._handle = x``) or invalidate it (``del proc._handle``).
+    Implemented as a non-data descriptor reading ``instance.__dict__``
+    directly: cached accesses cost one dict lookup instead of a property
+    dispatch + getattr/AttributeError round-trip.
+    """
+    def __init__(self, f):
+        self.func = f
+        self.cache_name = "_" + f.__name__
+        self.__doc__ = f.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
         try:
-            return getattr(self, cache_name)
-        except AttributeError:
-            setattr(self, cache_name, f(self))
-            return getattr(self, cache_name)
-    return property(prop, doc=f.__doc__)
+            return instance.__dict__[self.cache_name]
+        except KeyError:
+            value = self.func(instance)
+            instance.__dict__[self.cache_name] = value
+            return value
 
 
 # type replacement based on name
 def transform_ctypes_fields(struct, replacement):
-    return [(name, replacement.get(name, type)) for name, type in struct._fields_]
+    get_replacement = replacement.get
+    return [(name, get_replacement(name, ftype)) for name, ftype in struct._fields_]
+
+
+# String leaves are repr()-ed in dumps; hoisted as a constant (and defined so
+# the helper keeps working on Python 3 where basestring is gone)
+try:
+    _STR_TYPES = (basestring,)
+except NameError:
+    _STR_TYPES = (str, bytes)
+
+# Per-struct-type cache of (fname, bound field descriptor __get__, interned
+# ".fname" suffix): extracting a field through the cached getter is one C call
+# instead of getattr's name-based MRO walk, _fields_ is only iterated once per
+# type, and child names are built by concatenating the pre-interned suffix
+# instead of re-running str.format per field.
+_STRUCT_FIELD_GETTERS = {}
+
+def _get_field_getters(struct_type):
+    try:
+        return _STRUCT_FIELD_GETTERS[struct_type]
+    except KeyError:
+        getters = [(field[0], getattr(struct_type, field[0]).__get__, intern("." + field[0])) for field in struct_type._fields_]
+        _STRUCT_FIELD_GETTERS[struct_type] = getters
+        return getters
+
+
+def _sprint_ctypes_struct(struct, name, hexa, output):
+    # Iterative walk: the explicit stack replaces the old per-field recursion
+    # and lines are accumulated in 'output' so the caller can issue a single
+    # stdout write instead of one print() (lock + flush) per leaf.
+    # Stack entries are (struct, name, fname, getter): getter extracts field
+    # fname from 'struct', or is None if 'struct' is already the value to dump.
+    output_line = output.append
+    stack = [(struct, name, None, None)]
+    stack_push = stack.append
+    while stack:
+        struct, name, fname, getter = stack.pop()
+        if getter is not None:
+            try:
+                struct = getter(struct)
+            except Exception as e:
+                output_line("Error while printing <{0}> : {1}\n".format(fname, e))
+                continue
+
+        sprint_method = getattr(struct, "__sprint__", None)
+        if sprint_method is not None:
+            # Allow function to accept 'hexa' param
+            # But handle function that don't, So we can just do:
+            #  __sprint__ = __repr__
+            output_line("{0} -> {1}\n".format(name, sprint_method()))
+            continue
 
+        if isinstance(struct, _ctypes._Pointer):
+            # ctypes pointers are falsy iff NULL: no need for a c_void_p cast
+            if not struct:
+                output_line("{0} -> NULL\n".format(name))
+                continue
+            stack_push((struct[0], name + "<deref>", None, None))
+            continue
 
-def print_ctypes_struct(struct, name="", hexa=False):
-    sprint_method = getattr(struct, "__sprint__", None)
-    if sprint_method is not None:
-        # Allow function to accept 'hexa' param
-        # But handle function that don't, So we can just do:
-        #  __sprint__ = __repr__
-        print("{0} -> {1}".format(name, sprint_method()))
-        return
-
-    if isinstance(struct, _ctypes._Pointer):
-        if ctypes.cast(struct, ctypes.c_void_p).value is None:
-            print("{0} -> NULL".format(name))
-            return
-        return print_ctypes_struct(struct[0], name + "<deref>", hexa=hexa)
-
-    if not hasattr(struct, "_fields_"):
-        value = struct
-        if hasattr(struct, "value"):
-            value = struct.value
-
-        if isinstance(value, basestring):
-            value = repr(value)
-        if hexa and not isinstance(value, gdef.Flag):
-            try:
-                print("{0} -> {1}".format(name, hex(value)))
-                return
-            except TypeError:
-                pass
-        print("{0} -> {1}".format(name, value))
-        return
-
-    for fname, ftype in struct._fields_:
-        try:
-            value = getattr(struct, fname)
-        except Exception as e:
-            print("Error while printing <{0}> : {1}".format(fname, e))
+        fields = getattr(struct, "_fields_", None)
+        if fields is None:
+            value = struct
+            if hasattr(struct, "value"):
+                value = struct.value
+
+            # Explicit integer check: the old hex() try/except TypeError paid
+            # an exception setup per non-integer leaf just as control flow
+            if hexa and isinstance(value, (int, long)) and not isinstance(value, (bool, gdef.Flag)):
+                output_line("{0} -> {1}\n".format(name, hex(value)))
+                continue
+            if isinstance(value, _STR_TYPES):
+                value = repr(value)
+            output_line("{0} -> {1}\n".format(name, value))
             continue
-        print_ctypes_struct(value, "{0}.{1}".format(name, fname), hexa=hexa)
+
+        # Pushed in reverse so fields pop (and print) in declaration order
+        for field_name, field_getter, field_suffix in reversed(_get_field_getters(type(struct))):
+            stack_push((struct, name + field_suffix, field_name, field_getter))
+
+
+def print_ctypes_struct(struct, name="", hexa=False):
+    output = []
+    _sprint_ctypes_struct(struct, name, hexa, output)
+    sys.stdout.write("".join(output))
 
 
 def sprint(struct, name="struct", hexa=True):
@@ -71,14 +129,26 @@ def sprint(struct, name="struct", hexa=True):
     return print_ctypes_struct(struct, name=name, hexa=hexa)
 
 
+# Raw kernel32 prototypes resolved once at module level.
+# Declaring argtypes/restype lets ctypes use its precompiled conversion path
+# instead of inferring the type of every argument on each call.
+_kernel32 = ctypes.WinDLL("kernel32")
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [gdef.HANDLE]
+_CloseHandle.restype = gdef.BOOL
+_WaitForSingleObject = _kernel32.WaitForSingleObject
+_WaitForSingleObject.argtypes = [gdef.HANDLE, gdef.DWORD]
+_WaitForSingleObject.restype = gdef.DWORD
+
+
 class AutoHandle(object):
     """An abstract class that allow easy handle creation/destruction/wait"""
      # Big bypass to prevent missing reference at programm exit..
-    _close_function = ctypes.WinDLL("kernel32").CloseHandle
+    _close_function = _CloseHandle
     def _get_handle(self):
         raise NotImplementedError("{0} is abstract".format(type(self).__name__))
 
-    @property
+    @fixedpropety
     def handle(self):
         """An handle on the object
 
@@ -87,19 +157,27 @@ class AutoHandle(object):
            .. note::
                 The handle is automaticaly closed when the object is destroyed
         """
-        if hasattr(self, "_handle"):
-            return self._handle
-        self._handle = self._get_handle()
-        dbgprint("Open handle {0} for {1}".format(hex(self._handle), self), "HANDLE")
-        return self._handle
+        handle = self._get_handle()
+        dbgprint("Open handle {0} for {1}".format(hex(handle), self), "HANDLE")
+        return handle
 
     def wait(self, timeout=gdef.INFINITE):
         """Wait for the object"""
-        return winproxy.WaitForSingleObject(self.handle, timeout)
-
-    def __del__(self):
+        # Direct prototype call: skips the winproxy dispatch layer on what is
+        # typically a polling hot path. Error contract matches
+        # winproxy.WaitForSingleObject (succeed_on_zero).
+        res = _WaitForSingleObject(self.handle, timeout)
+        if res:
+            raise winproxy.WinproxyError("WaitForSingleObject")
+        return res
+
+    def __del__(self, _sys=sys, _dbgprint=dbgprint, _close_function=_CloseHandle):
+        # Default arguments capture the globals used here at class-creation
+        # time: CPython nulls module globals during interpreter teardown,
+        # which is what the old hasattr/'is not None' dance defended against
         # sys.path is not None -> check if python shutdown
-        if hasattr(sys, "path") and sys.path is not None and hasattr(self, "_handle") and self._handle:
-            # Prevent some bug where dbgprint might be None when __del__ is called in a closing process
-            dbgprint("Closing Handle {0} for {1}".format(hex(self._handle), self), "HANDLE") if dbgprint is not None else None
-            self._close_function(self._handle)
\ No newline at end of file
+        # __dict__.get avoids re-triggering the handle descriptor at teardown
+        handle = self.__dict__.get("_handle")
+        if handle and _sys.path is not None:
+            _dbgprint("Closing Handle {0} for {1}".format(hex(handle), self), "HANDLE")
+            _close_function(handle)
\ No newline at end of file
@@ -4,10 +4,12 @@ import os
 import copy
 import time
 import struct
-import itertools
+import threading
+import array
+import bisect
 
 from contextlib import contextmanager
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 
 import windows
 import windows.native_exec.simple_x86 as x86
@@ -32,6 +34,66 @@ from windows.winobject import token
 TimeInfo = namedtuple("TimeInfo", ["creation", "exit", "kernel", "user"])
 """Time information about a process"""
 
+# Precompiled unpackers for the fixed-size remote reads: struct.unpack would
+# re-parse the format string and rebuild the Struct on every pointer-chasing
+# read (the innermost loop of PE parsing / PEB walks)
+_UNPACK_BYTE = struct.Struct("<B").unpack
+_UNPACK_SHORT = struct.Struct("<H").unpack
+
+# Raw kernel32 prototypes for the exit-code polling hot paths (same motive as
+# utils.AutoHandle._close_function): one prototyped C call instead of the
+# winproxy dispatch layer. Error contract matches winproxy (fail_on_zero).
+_kernel32 = ctypes.WinDLL("kernel32")
+_GetExitCodeThread = _kernel32.GetExitCodeThread
+_GetExitCodeThread.argtypes = [HANDLE, ctypes.POINTER(DWORD)]
+_GetExitCodeThread.restype = BOOL
+_GetExitCodeProcess = _kernel32.GetExitCodeProcess
+_GetExitCodeProcess.argtypes = [HANDLE, ctypes.POINTER(DWORD)]
+_GetExitCodeProcess.restype = BOOL
+# The remote-read path is the innermost loop of PE parsing, PEB walks and
+# string reads: skip the winproxy keyword dispatch there as well
+_ReadProcessMemory = _kernel32.ReadProcessMemory
+_ReadProcessMemory.argtypes = [HANDLE, PVOID, PVOID, ctypes.c_size_t, PVOID]
+_ReadProcessMemory.restype = BOOL
+_WriteProcessMemory = _kernel32.WriteProcessMemory
+_WriteProcessMemory.argtypes = [HANDLE, PVOID, PVOID, ctypes.c_size_t, PVOID]
+_WriteProcessMemory.restype = BOOL
+_VirtualQueryEx = _kernel32.VirtualQueryEx
+_VirtualQueryEx.argtypes = [HANDLE, PVOID, PVOID, ctypes.c_size_t]
+_VirtualQueryEx.restype = ctypes.c_size_t
+
+# Hoisted out of query_memory, which memory_state may call tens of
+# thousands of times per address-space walk
+_MBI_TYPE = {32: MEMORY_BASIC_INFORMATION32, 64: MEMORY_BASIC_INFORMATION64}
+
+# Thread-local scratch ctypes objects: the small fixed-size hot paths
+# (read_byte..read_qword, exit_code polling) otherwise allocate a fresh
+# ctypes buffer per call, which dominates tight remote-inspection loops.
+# Safe because the scratch is filled and copied out within a single call
+# with no reentry in between.
+_TLS = threading.local()
+
+def _scratch_buffer(size):
+    try:
+        buffers = _TLS.buffers
+    except AttributeError:
+        buffers = _TLS.buffers = {}
+    try:
+        return buffers[size]
+    except KeyError:
+        buffer = ctypes.create_string_buffer(size)
+        buffers[size] = buffer
+        return buffer
+
+def _scratch_dword():
+    try:
+        return _TLS.dword
+    except AttributeError:
+        res = _TLS.dword = DWORD()
+        return res
+_UNPACK_DWORD = struct.Struct("<I").unpack
+_UNPACK_QWORD = struct.Struct("<Q").unpack
+
 
 class DeadThread(utils.AutoHandle):
     """An already dead thread (returned only by API returning a new thread if thread die before being returned)"""
@@ -56,8 +118,9 @@ class DeadThread(utils.AutoHandle):
 
         :type: :class:`int`
 		"""
-        res = DWORD()
-        winproxy.GetExitCodeThread(self.handle, byref(res))
+        res = _scratch_dword()
+        if not _GetExitCodeThread(self.handle, byref(res)):
+            raise winproxy.WinproxyError("GetExitCodeThread")
         return res.value
 
 
@@ -92,10 +155,13 @@ class Process(utils.AutoHandle):
 
 
     @utils.fixedpropety
-    def ppid(self):
-        """Parent Process ID
-
-        :type: :class:`int`
+    def _process_basic_information(self):
+        """The PROCESS_BASIC_INFORMATION of the process; from a 32bits
+        interpreter on a 64bits target this is the remote64bits transformed
+        structure (raw bytes kept alive in its ``_data``). Cached: the fields
+        consumed here (PebBaseAddress, InheritedFromUniqueProcessId) are fixed
+        for the lifetime of the process, and ppid/peb_addr used to each redo
+        this exact NtQueryInformationProcess call.
 		"""
         if windows.current_process.bitness == 32 and self.bitness == 64:
             xtype = windows.remotectypes.transform_type_to_remote64bits(PROCESS_BASIC_INFORMATION)
@@ -104,11 +170,19 @@ class Process(utils.AutoHandle):
             windows.syswow64.NtQueryInformationProcess_32_to_64(self.handle, ProcessInformation=data, ProcessInformationLength=ctypes.sizeof(xtype))
             # Map a remote64bits(PROCESS_BASIC_INFORMATION) at the address of 'data'
             x = xtype(ctypes.addressof(data), windows.current_process)
-        else:
-            information_type = 0
-            x = PROCESS_BASIC_INFORMATION()
-            winproxy.NtQueryInformationProcess(self.handle, information_type, x)
-        return x.InheritedFromUniqueProcessId
+            x._data = data # Keep the queried buffer alive with the mapping
+            return x
+        x = PROCESS_BASIC_INFORMATION()
+        winproxy.NtQueryInformationProcess(self.handle, 0, x)
+        return x
+
+    @utils.fixedpropety
+    def ppid(self):
+        """Parent Process ID
+
+        :type: :class:`int`
+		"""
+        return self._process_basic_information.InheritedFromUniqueProcessId
 
     @property
     def threads(self):
@@ -116,8 +190,28 @@ class Process(utils.AutoHandle):
 
         :type: [:class:`WinThread`] -- A list of Thread
 		"""
+        # Walk the snapshot directly (no generator resumption per system
+        # thread) and filter on the raw pid before building any WinThread:
+        # on a loaded system ~99% of the entries belong to other processes
+        dbgprint("Enumerating threads of {0} with CreateToolhelp32Snapshot".format(self.pid), "SLOW")
         owner_pid = self.pid
-        return [WinThread._from_THREADENTRY32(th, owner=self) for th in windows.system.enumerate_threads_generator() if th.th32OwnerProcessID == owner_pid]
+        thread_entry = THREADENTRY32()
+        thread_entry.dwSize = ctypes.sizeof(thread_entry)
+        snap = winproxy.CreateToolhelp32Snapshot(gdef.TH32CS_SNAPTHREAD, 0)
+        next_entry = winproxy.Thread32Next
+        from_entry = WinThread._from_THREADENTRY32
+        res = []
+        append_thread = res.append
+        try:
+            winproxy.Thread32First(snap, thread_entry)
+            if thread_entry.th32OwnerProcessID == owner_pid:
+                append_thread(from_entry(thread_entry, owner=self))
+            while next_entry(snap, thread_entry):
+                if thread_entry.th32OwnerProcessID == owner_pid:
+                    append_thread(from_entry(thread_entry, owner=self))
+        finally:
+            winproxy.CloseHandle(snap)
+        return res
 
     def virtual_alloc(self, size):
         raise NotImplementedError("virtual_alloc")
@@ -131,8 +225,9 @@ class Process(utils.AutoHandle):
 
         :type: :class:`int`
 		"""
-        res = DWORD()
-        winproxy.GetExitCodeProcess(self.handle, byref(res))
+        res = _scratch_dword()
+        if not _GetExitCodeProcess(self.handle, byref(res)):
+            raise winproxy.WinproxyError("GetExitCodeProcess")
         return res.value
 
     @property
@@ -207,10 +302,12 @@ class Process(utils.AutoHandle):
                 raise
             return res
 
-        info_type = {32 : MEMORY_BASIC_INFORMATION32, 64 : MEMORY_BASIC_INFORMATION64}
-        res = info_type[windows.current_process.bitness]()
-        ptr = ctypes.cast(byref(res), POINTER(MEMORY_BASIC_INFORMATION))
-        winproxy.VirtualQueryEx(self.handle, addr, ptr, sizeof(res))
+        # byref(res) goes straight to the PVOID-typed raw prototype: the old
+        # per-call ctypes.cast to POINTER(MEMORY_BASIC_INFORMATION) built a
+        # new pointer object only to satisfy the winproxy argtypes
+        res = _MBI_TYPE[windows.current_process.bitness]()
+        if not _VirtualQueryEx(self.handle, addr, byref(res), sizeof(res)):
+            raise winproxy.WinproxyError("VirtualQueryEx")
         return res
 
     def memory_state(self):
@@ -218,14 +315,17 @@ class Process(utils.AutoHandle):
 
         :yield: :class:`~windows.generated_def.winstructs.MEMORY_BASIC_INFORMATION`
 		"""
+        # One VirtualQueryEx per region is the API granularity (free gaps are
+        # already returned as a single region); only the Python-side cost per
+        # region can be trimmed, so resolve query_memory once for the walk
         addr = 0
-        res = []
+        query_memory = self.query_memory
         while True:
             try:
-                x = self.query_memory(addr)
-                yield x
+                x = query_memory(addr)
             except winproxy.WinproxyError:
                 return
+            yield x
             addr += x.RegionSize
 
     def query_working_set(self):
@@ -314,49 +414,52 @@ class Process(utils.AutoHandle):
 
     def read_byte(self, addr):
         """Read a ``CHAR`` at ``addr``"""
-        sizeof_char = sizeof(CHAR)
-        return struct.unpack("<B", self.read_memory(addr, sizeof_char))[0]
+        return _UNPACK_BYTE(self.read_memory(addr, 1))[0]
 
     def read_short(self, addr):
         """Read a ``SHORT`` at ``addr``"""
-        sizeof_short = sizeof(ctypes.c_short)
-        return struct.unpack("<H", self.read_memory(addr, sizeof_short))[0]
+        return _UNPACK_SHORT(self.read_memory(addr, 2))[0]
 
     def read_dword(self, addr):
         """Read a ``DWORD`` at ``addr``"""
-        sizeof_dword = sizeof(DWORD)
-        return struct.unpack("<I", self.read_memory(addr, sizeof_dword))[0]
+        return _UNPACK_DWORD(self.read_memory(addr, 4))[0]
 
     def read_qword(self, addr):
         """Read a ``ULONG64`` at ``addr``"""
-        sizeof_qword = sizeof(ULONG64)
-        return struct.unpack("<Q", self.read_memory(addr, sizeof_qword))[0]
+        return _UNPACK_QWORD(self.read_memory(addr, 8))[0]
 
-    def read_ptr(self, addr):
-        """Read a ``PTR`` at ``addr``"""
+    @utils.fixedpropety
+    def read_ptr(self):
+        """Read a ``PTR`` at ``addr``.
+
+        Bitness is fixed per process, so the branch is resolved once: the
+        cached attribute is the bound :func:`read_dword` or :func:`read_qword`
+        and pointer-chasing loops skip the comparison on every call.
+		"""
         if self.bitness == 32:
-            return self.read_dword(addr)
-        return self.read_qword(addr)
+            return self.read_dword
+        return self.read_qword
 
     def read_string(self, addr):
         """Read an ascii string at ``addr``"""
         res = []
         read_size = 0x100
         readden = 0
-        for i in itertools.count():
+        while True:
             try:
                 x = self.read_memory(addr + readden, read_size)
             except winproxy.WinproxyError as e:
                 if read_size == 2:
                     raise
-                # handle read_wstring at end of page
+                # handle read_string at end of page
                 # Of read failed: read only the half of size
                 # read_size must remain a multiple of 2
                 read_size = read_size / 2
                 continue
             readden += read_size
-            if "\x00" in x:
-                res.append(x.split("\x00", 1)[0])
+            end = x.find("\x00")
+            if end >= 0:
+                res.append(x[:end])
                 break
             res.append(x)
         return "".join(res)
@@ -366,7 +469,6 @@ class Process(utils.AutoHandle):
         res = []
         read_size = 0x100
         readden = 0
-        # I am trying to do something smart here..
         while True:
             try:
                 x = self.read_memory(addr + readden, read_size)
@@ -379,12 +481,45 @@ class Process(utils.AutoHandle):
                 read_size = read_size / 2
                 continue
             readden += read_size
-            utf16_chars = ["".join(c) for c in zip(*[iter(x)] * 2)]
-            if "\x00\x00" in utf16_chars:
-                res.extend(utf16_chars[:utf16_chars.index("\x00\x00")])
+            # UTF16 terminator: two 0 bytes on an even (char-aligned) offset.
+            # bytes.find does the scanning at C speed; just skip odd matches.
+            end = x.find("\x00\x00")
+            while end > 0 and end & 1:
+                end = x.find("\x00\x00", end + 1)
+            if end >= 0:
+                res.append(x[:end])
                 break
-            res.extend(x)
-        return "".join(res).decode('utf16')
+            res.append(x)
+        return "".join(res).decode('utf-16-le')
+
+    def read_batch(self, ranges, gap=0x1000):
+        """Read several ``(addr, size)`` ranges in few reads: ranges closer
+        than ``gap`` bytes are coalesced into one :func:`read_memory` call and
+        the result is sliced per request. Typical PE walks (DOS header, NT
+        header, section headers, ...) land within a few pages, so dozens of
+        small reads collapse into a handful of syscalls.
+
+        :param ranges: [(:class:`int`, :class:`int`)] -- A list of (addr, size)
+        :return: {addr: data} for each requested range
+        :rtype: :class:`dict`
+		"""
+        requests = sorted(ranges)
+        read_memory = self.read_memory
+        res = {}
+        i = 0
+        nb_requests = len(requests)
+        while i < nb_requests:
+            start, size = requests[i]
+            end = start + size
+            j = i + 1
+            while j < nb_requests and requests[j][0] - end <= gap:
+                end = max(end, requests[j][0] + requests[j][1])
+                j += 1
+            data = read_memory(start, end - start)
+            for addr, size in requests[i:j]:
+                res[addr] = data[addr - start: addr - start + size]
+            i = j
+        return res
 
     def write_byte(self, addr, byte):
         """write a byte at ``addr``"""
@@ -402,11 +537,13 @@ class Process(utils.AutoHandle):
         """write a qword at ``addr``"""
         return self.write_memory(addr, struct.pack("<Q", qword))
 
-    def write_ptr(self, addr, value):
-        """Write a ``PTR`` at ``addr``"""
+    @utils.fixedpropety
+    def write_ptr(self):
+        """Write a ``PTR`` at ``addr``: the bound :func:`write_dword` or
+        :func:`write_qword`, resolved once like :func:`read_ptr`"""
         if self.bitness == 32:
-            return self.write_dword(addr, value)
-        return self.write_qword(addr, value)
+            return self.write_dword
+        return self.write_qword
 
     @property
     def time_info(self):
@@ -471,16 +608,18 @@ class Process(utils.AutoHandle):
 
     token = property(open_token, doc="The process :class:`~windows.winobject.token.Token`")
 
-    def __del__(self):
+    def __del__(self, _sys=sys, _dbgprint=dbgprint, _close_function=utils.AutoHandle._close_function):
         super(Process, self).__del__()
         # Same logic that AutoHandle.__del__ for Process.limited_handle
         # Assert that Process inherit AutoHandle
+        # Default arguments capture the globals needed during interpreter
+        # teardown (module dicts may already be nulled at that point)
         # sys.path is not None -> check if python shutdown
-        if sys.path is not None and hasattr(self, "_limited_handle") and self._limited_handle:
-            # Prevent some bug where dbgprint might be None when __del__ is called in a closing process
+        limited_handle = self.__dict__.get("_limited_handle")
+        if limited_handle and _sys.path is not None:
             # This line is bad -> it reopens a handle closed by 'super(Process, self).__del__()' ._.
-            dbgprint("Closing limited handle {0} for {1}".format(hex(self._limited_handle), self), "HANDLE") if dbgprint is not None else None
-            self._close_function(self._limited_handle)
+            _dbgprint("Closing limited handle {0} for {1}".format(hex(limited_handle), self), "HANDLE")
+            _close_function(limited_handle)
 
 class Thread(utils.AutoHandle):
     def open_token(self, flags=MAXIMUM_ALLOWED, as_self=False):
@@ -574,13 +713,16 @@ class CurrentProcess(Process):
 
     # Use RtlGetCurrentPeb ?
     def get_peb_builtin(self):
+        # The stub only depends on the interpreter bitness: generate it once
+        # and cache it at class scope, so the codegen + executable page
+        # allocation is never redone (the old code cached per instance)
         if self.get_peb is not None:
             return self.get_peb
         if self.bitness == 32:
             get_peb = native_exec.create_function(self.get_peb_32_code, [PVOID])
         else:
             get_peb = native_exec.create_function(self.get_peb_64_code, [PVOID])
-        self.get_peb = get_peb
+        CurrentProcess.get_peb = get_peb
         return get_peb
 
     def _get_handle(self):
@@ -735,32 +877,42 @@ class WinThread(Thread):
 		"""
         return WinProcess(pid=self.owner_pid)
 
-    @property
-    def context(self):
-        """The context of the thread, type depend of the target process.
+    def context_into(self, ctx):
+        """Refill ``ctx`` (a context of the type :data:`context` returns for
+        this thread) in place. Debugger/stack-walk loops can keep one context
+        per thread and skip the per-call allocation (``new_aligned`` is not
+        free); ``ContextFlags`` is kept if already set, else ``CONTEXT_ALL``.
 
-        :type: :class:`windows.exception.ECONTEXT32` or  :class:`windows.exception.ECONTEXT64` or :class:`windows.exception.ECONTEXTWOW64`
+        :return: ``ctx``
 		"""
+        if not ctx.ContextFlags:
+            ctx.ContextFlags = CONTEXT_ALL
         if self.owner.bitness == 32 and windows.current_process.bitness == 64:
             # Wow64
-            x = exception.ECONTEXTWOW64()
-            x.ContextFlags = CONTEXT_ALL
-            winproxy.Wow64GetThreadContext(self.handle, x)
-            return x
-
-        if self.owner.bitness == 64 and windows.current_process.bitness == 32:
-            x = exception.ECONTEXT64.new_aligned()
-            x.ContextFlags = CONTEXT_ALL
-            windows.syswow64.NtGetContextThread_32_to_64(self.handle, x)
-            return x
+            winproxy.Wow64GetThreadContext(self.handle, ctx)
+        elif self.owner.bitness == 64 and windows.current_process.bitness == 32:
+            windows.syswow64.NtGetContextThread_32_to_64(self.handle, ctx)
+        else:
+            winproxy.GetThreadContext(self.handle, ctx)
+        return ctx
 
+    def _new_context(self):
         if self.owner.bitness == 32:
-            x = exception.ECONTEXT32()
-        else:
-            x = exception.ECONTEXT64.new_aligned()
-        x.ContextFlags = CONTEXT_ALL
-        winproxy.GetThreadContext(self.handle, x)
-        return x
+            if windows.current_process.bitness == 64:
+                return exception.ECONTEXTWOW64()
+            return exception.ECONTEXT32()
+        return exception.ECONTEXT64.new_aligned()
+
+    @property
+    def context(self):
+        """The context of the thread, type depend of the target process.
+
+        Each access returns a fresh object (callers routinely keep several
+        contexts alive); use :func:`context_into` to reuse one in a loop.
+
+        :type: :class:`windows.exception.ECONTEXT32` or  :class:`windows.exception.ECONTEXT64` or :class:`windows.exception.ECONTEXTWOW64`
+		"""
+        return self.context_into(self._new_context())
 
     @property
     def context_syswow(self):
@@ -866,8 +1018,9 @@ class WinThread(Thread):
 
         :type: :class:`int`
 		"""
-        res = DWORD()
-        winproxy.GetExitCodeThread(self.handle, byref(res))
+        res = _scratch_dword()
+        if not _GetExitCodeThread(self.handle, byref(res)):
+            raise winproxy.WinproxyError("GetExitCodeThread")
         return res.value
 
     def __repr__(self):
@@ -976,13 +1129,83 @@ class WinProcess(Process):
         """Free memory in the process by virtual_alloc"""
         return winproxy.VirtualFreeEx(self.handle, addr)
 
+    def map_shared_memory(self, size, local_protect=PAGE_READWRITE, remote_protect=PAGE_EXECUTE_READWRITE):
+        """Map a new pagefile-backed section in the current and the target
+        process: bytes written at ``local_addr`` are visible in the target
+        without any :func:`write_memory`.
+
+        :return: ``(local_addr, remote_addr)``
+        :rtype: (:class:`int`, :class:`int`)
+		"""
+        section = HANDLE()
+        max_size = LARGE_INTEGER(size)
+        winproxy.NtCreateSection(byref(section), gdef.SECTION_ALL_ACCESS, None, byref(max_size), PAGE_EXECUTE_READWRITE, gdef.SEC_COMMIT, None)
+        try:
+            local_addr = PVOID()
+            view_size = SIZE_T(size)
+            winproxy.NtMapViewOfSection(section, winproxy.GetCurrentProcess(), byref(local_addr), 0, 0, None, byref(view_size), gdef.ViewUnmap, 0, local_protect)
+            remote_addr = PVOID()
+            view_size = SIZE_T(size)
+            winproxy.NtMapViewOfSection(section, self.handle, byref(remote_addr), 0, 0, None, byref(view_size), gdef.ViewUnmap, 0, remote_protect)
+        finally:
+            # The views keep the section alive
+            winproxy.CloseHandle(section)
+        return local_addr.value, remote_addr.value
+
+    def execute(self, code, parameter=0):
+        """Execute some native code in the context of the process
+
+        :return: The thread executing the code
+        :rtype: :class:`WinThread` or :class:`DeadThread`
+		"""
+        if windows.current_process.bitness == 32 and self.bitness == 64:
+            # No NtMapViewOfSection syswow64 helper: keep alloc+write+thread
+            return super(WinProcess, self).execute(code, parameter)
+        # Shared section: the code is written through the local view, which
+        # spares the WriteProcessMemory cross-process copy of the old
+        # alloc+write path (the remote view leaks, just like virtual_alloc did)
+        local_addr, remote_addr = self.map_shared_memory(len(code))
+        ctypes.memmove(local_addr, code, len(code))
+        winproxy.NtUnmapViewOfSection(winproxy.GetCurrentProcess(), local_addr)
+        return self.create_thread(remote_addr, parameter)
+
+    # Opt-in page cache for read_memory (the old '_cache_cache' experiment,
+    # bounded and write-invalidated): PE parsing re-reads the same few pages
+    # (headers, import/export tables) many times over
+    _memory_cache = None
+    _MEMORY_CACHE_PAGES = 256
+
+    def enable_memory_cache(self):
+        """Enable a bounded page cache for :func:`read_memory`.
+
+        Reads are served from cached ``0x1000``-bytes pages where possible,
+        cutting the syscall count sharply on workloads that re-read the same
+        memory (PE parsing, PEB walks). :func:`write_memory` invalidates the
+        pages it touches, but memory rewritten by the target process itself
+        will be served stale: only enable this when the memory read is known
+        to be static, and use :func:`disable_memory_cache` once done.
+		"""
+        if self._memory_cache is None:
+            self._memory_cache = OrderedDict()
+
+    def disable_memory_cache(self):
+        """Disable (and drop) the :func:`read_memory` page cache"""
+        self._memory_cache = None
+
     def write_memory(self, addr, data):
         """Write `data` at `addr`"""
+        cache = self._memory_cache
+        if cache is not None:
+            for page_addr in range(addr & ~0xfff, addr + len(data), 0x1000):
+                cache.pop(page_addr, None)
         if windows.current_process.bitness == 32 and self.bitness == 64:
             if not winproxy.is_implemented(winproxy.NtWow64WriteVirtualMemory64):
                 raise ValueError("NtWow64WriteVirtualMemory64 non available in ntdll: cannot write into 64bits processus")
             return winproxy.NtWow64WriteVirtualMemory64(self.handle, addr, data, len(data))
-        return winproxy.WriteProcessMemory(self.handle, addr, lpBuffer=data)
+        # Raw prototype call, like low_read_memory; same fail_on_zero contract
+        if not _WriteProcessMemory(self.handle, addr, data, len(data), None):
+            raise winproxy.WinproxyError("WriteProcessMemory")
+        return True
 
     def low_read_memory(self, addr, buffer_addr, size):
         if windows.current_process.bitness == 32 and self.bitness == 64:
@@ -992,35 +1215,68 @@ class WinProcess(Process):
             return winproxy.NtWow64ReadVirtualMemory64(self.handle, addr, buffer_addr, size)
         #if self.is_wow_64 and addr > 0xffffffff:
         #    return winproxy.NtWow64ReadVirtualMemory64(self.handle, addr, buffer_addr, size)
-        return winproxy.ReadProcessMemory(self.handle, addr, lpBuffer=buffer_addr, nSize=size)
+        # Raw prototype call; the zero-return check matches the winproxy
+        # fail_on_zero errcheck
+        if not _ReadProcessMemory(self.handle, addr, buffer_addr, size, None):
+            raise winproxy.WinproxyError("ReadProcessMemory")
+        return True
 
-    def read_memory(self, addr, size):
-        """Read ``size`` from ``addr``
+    def read_memory(self, addr, size, out=None):
+        """Read ``size`` from ``addr``.
+
+        If ``out`` (a :class:`bytearray` of at least ``size`` bytes) is given
+        the data is read straight into it and ``out`` is returned: no
+        intermediate ctypes buffer and no final copy, which halves the bytes
+        moved per read in tight loops.
 
         :return: The data read
-        :rtype: :class:`str`
+        :rtype: :class:`str` (or ``out``)
 		"""
-        buffer = ctypes.create_string_buffer(size)
+        if out is not None:
+            cbuf = (ctypes.c_char * size).from_buffer(out)
+            self.low_read_memory(addr, ctypes.byref(cbuf), size)
+            return out
+        cache = self._memory_cache
+        if cache is not None:
+            return self._read_memory_cached(cache, addr, size)
+        if size <= 0x10:
+            # Fixed-size reads (read_byte..read_qword, read_ptr) reuse a
+            # per-thread scratch buffer instead of allocating one per call
+            buffer = _scratch_buffer(size)
+        else:
+            buffer = ctypes.create_string_buffer(size)
         self.low_read_memory(addr, ctypes.byref(buffer), size)
-        return buffer[:]
+        return buffer[:size]
 
-    # Simple cache test
-    # real_read = read_memory
-    #
-    # def read_memory(self, addr, size):
-    #     """Cached version for test"""
-    #     dbgprint('Read remote Memory of {0}'.format(self), 'READMEM')
-    #     if not hasattr(self, "_cache_cache"):
-    #         self._cache_cache = {}
-    #     page_addr = addr & 0xfffffffffffff000
-    #     if page_addr in self._cache_cache:
-    #         #print("CACHED Read on page {0}".format(hex(page_addr)))
-    #         page_data = self._cache_cache[page_addr]
-    #         return page_data[addr & 0xfff: (addr & 0xfff) + size]
-    #     else:
-    #         page_data = self.real_read(page_addr, 0x1000)
-    #         self._cache_cache[page_addr] = page_data
-    #         return page_data[addr & 0xfff: (addr & 0xfff) + size]
+    def _read_page_cached(self, cache, page_addr):
+        try:
+            # pop + reinsert keeps the OrderedDict in LRU order
+            page = cache.pop(page_addr)
+        except KeyError:
+            buffer = ctypes.create_string_buffer(0x1000)
+            self.low_read_memory(page_addr, ctypes.byref(buffer), 0x1000)
+            page = buffer[:]
+            if len(cache) >= self._MEMORY_CACHE_PAGES:
+                cache.popitem(last=False)
+        cache[page_addr] = page
+        return page
+
+    def _read_memory_cached(self, cache, addr, size):
+        offset = addr & 0xfff
+        page_addr = addr - offset
+        if offset + size <= 0x1000:
+            return self._read_page_cached(cache, page_addr)[offset:offset + size]
+        # Read spanning several pages: per-page failure semantics match a
+        # single ReadProcessMemory, which fails wholesale if any page is bad
+        parts = []
+        remaining = size
+        while remaining > 0:
+            chunk_size = min(remaining, 0x1000 - offset)
+            parts.append(self._read_page_cached(cache, page_addr)[offset:offset + chunk_size])
+            remaining -= chunk_size
+            offset = 0
+            page_addr += 0x1000
+        return "".join(parts)
 
     def read_memory_into(self, addr, struct):
         """Read a :mod:`ctypes` struct from `addr`
@@ -1071,22 +1327,16 @@ class WinProcess(Process):
             :type: :class:`int`
 		"""
         if windows.current_process.bitness == 32 and self.bitness == 64:
-            x = windows.remotectypes.transform_type_to_remote64bits(PROCESS_BASIC_INFORMATION)
-            # Fuck-it <3
-            data = (ctypes.c_char * ctypes.sizeof(x))()
-            windows.syswow64.NtQueryInformationProcess_32_to_64(self.handle, ProcessInformation=data, ProcessInformationLength=ctypes.sizeof(x))
-            peb_offset = x.PebBaseAddress.offset
-            peb_addr = struct.unpack("<Q", data[x.PebBaseAddress.offset: x.PebBaseAddress.offset+8])[0]
+            pbi = self._process_basic_information
+            peb_offset = type(pbi).PebBaseAddress.offset
+            peb_addr = struct.unpack("<Q", pbi._data[peb_offset: peb_offset + 8])[0]
         elif windows.current_process.bitness == 64 and self.bitness == 32:
             information_type = 26
             y = ULONGLONG()
             winproxy.NtQueryInformationProcess(self.handle, information_type, byref(y), sizeof(y))
             peb_addr = y.value
         else:
-            information_type = 0
-            x = PROCESS_BASIC_INFORMATION()
-            winproxy.NtQueryInformationProcess(self.handle, information_type, x)
-            peb_addr = ctypes.cast(x.PebBaseAddress, PVOID).value
+            peb_addr = ctypes.cast(self._process_basic_information.PebBaseAddress, PVOID).value
         if peb_addr is None:
             raise ValueError("Could not get peb addr of process {0}".format(self.name))
         return peb_addr
@@ -1110,12 +1360,11 @@ class WinProcess(Process):
         if not self.is_wow_64:
             raise ValueError("Not a syswow process")
         if windows.current_process.bitness == 64:
-            information_type = 0
-            x = PROCESS_BASIC_INFORMATION()
-            winproxy.NtQueryInformationProcess(self.handle, information_type, x)
-            peb_addr = ctypes.cast(x.PebBaseAddress, PVOID).value
-            return peb_addr
+            return ctypes.cast(self._process_basic_information.PebBaseAddress, PVOID).value
         else: #current is 32bits
+            # Cannot reuse _process_basic_information: from a 32bits
+            # interpreter on a wow64 target it holds the 32bits view, and the
+            # 64bits PebBaseAddress is wanted here
             x = windows.remotectypes.transform_type_to_remote64bits(PROCESS_BASIC_INFORMATION)
             # Fuck-it <3
             data = (ctypes.c_char * ctypes.sizeof(x))()
@@ -1146,10 +1395,6 @@ class WinProcess(Process):
 
 
 
-def transform_ctypes_fields(struct, replacement):
-    return [(name, replacement.get(name, type)) for name, type in struct._fields_]
-
-
 class LoadedModule(LDR_DATA_TABLE_ENTRY):
     """An entry in the PEB Ldr list"""
     @property
@@ -1160,7 +1405,9 @@ class LoadedModule(LDR_DATA_TABLE_ENTRY):
 		"""
         return self.DllBase
 
-    @property
+    # name/fullname are fixedpropety: walking hundreds of modules re-reads
+    # the same UNICODE_STRINGs (remote ones via ReadProcessMemory) otherwise
+    @utils.fixedpropety
     def name(self):
         """Name of the module
 
@@ -1168,7 +1415,7 @@ class LoadedModule(LDR_DATA_TABLE_ENTRY):
 		"""
         return self.BaseDllName.str.lower()
 
-    @property
+    @utils.fixedpropety
     def fullname(self):
         """Full name of the module (path)
 
@@ -1189,8 +1436,61 @@ class LoadedModule(LDR_DATA_TABLE_ENTRY):
 
 
 class LIST_ENTRY_PTR(PVOID):
+    # Kept for API compat: the module walks thread raw integers and no
+    # longer cast through this type
     def TO_LDR_ENTRY(self):
-        return LDR_DATA_TABLE_ENTRY.from_address(self.value - sizeof(PVOID) * 2)
+        return LDR_DATA_TABLE_ENTRY.from_address(self.value - _LDR_ENTRY_OFFSET)
+
+
+# Offset of a LDR_DATA_TABLE_ENTRY from its InMemoryOrderLinks (the two
+# InLoadOrderLinks pointers of the target bitness): computed once instead of
+# a ctypes.sizeof per node in the walk loops
+_LDR_ENTRY_OFFSET = ctypes.sizeof(ctypes.c_void_p) * 2
+_LDR_ENTRY_OFFSET64 = ctypes.sizeof(rctypes.c_void_p64) * 2
+_LDR_ENTRY_OFFSET32 = ctypes.sizeof(rctypes.c_void_p32) * 2
+_INMEMLINKS_OFFSET = LDR_DATA_TABLE_ENTRY.InMemoryOrderLinks.offset
+_INMEM_LIST_OFFSET = PEB_LDR_DATA.InMemoryOrderModuleList.offset
+
+# Pre-built pointer unpackers: struct.Struct compiles the format once,
+# where struct.unpack_from re-parses the format string on every call
+_PTR64 = struct.Struct("<Q").unpack_from
+_PTR32 = struct.Struct("<I").unpack_from
+_PTR_NATIVE = _PTR64 if ctypes.sizeof(ctypes.c_void_p) == 8 else _PTR32
+
+
+def _iter_remote_ldr(peb, module_cls, entry_offset, unpack_ptr, inmem_offset):
+    """Walk the InMemoryOrder LDR list of a remote PEB, one bulk
+    read_memory per node: the loop-control fields (DllBase / Flink) are
+    unpacked from the local header bytes instead of going through the
+    RemoteStructure field descriptors (one ReadProcessMemory per access).
+    Yields lazy ``module_cls`` views over the entries, so a caller that
+    stops early skips the remaining remote reads.
+    """
+    # Read Ldr once as a raw integer: it both answers the NULL check and
+    # seeds the walk, where .value + .contents dereferenced it twice
+    ldr_addr = peb.Ldr.raw_value
+    if not ldr_addr:
+        raise ValueError("PEB->Ldr is NULL: cannot walk the module list")
+    target = peb._target
+    read_memory = target.read_memory
+    ptr_size = entry_offset // 2
+    dllbase_offset = module_cls.DllBase.offset
+    links_offset = module_cls.InMemoryOrderLinks.offset
+    header_size = dllbase_offset + ptr_size
+    entry_addr = unpack_ptr(read_memory(ldr_addr + inmem_offset, ptr_size))[0] - entry_offset
+    while True:
+        header = read_memory(entry_addr, header_size)
+        if not unpack_ptr(header, dllbase_offset)[0]:
+            return
+        yield module_cls(entry_addr, target)
+        entry_addr = unpack_ptr(header, links_offset)[0] - entry_offset
+
+
+ModuleSnapshot = namedtuple("ModuleSnapshot", ["bases", "sizes", "names"])
+"""Parallel columns describing the loaded modules, sorted by base address:
+``bases`` is a list of ints (array has no 64-bit typecode on Python 2),
+``sizes`` an ``array('L')`` and ``names`` the matching list of lowercase
+module names"""
 
 
 class PEB(gdef.PEB):
@@ -1204,21 +1504,56 @@ class PEB(gdef.PEB):
         """
         return windows.pe_parse.GetPEFile(self.ImageBaseAddress)
 
-    @property
+    # process_parameters/imagepath/commandline are immutable after startup
+    # for the current process: cache them instead of rebuilding the
+    # ProcessParameters pointer proxy (.contents allocates a fresh one)
+    # on every access. The RemotePEB variants override these with plain
+    # properties (the target can rewrite its PEB).
+    @utils.fixedpropety
+    def process_parameters(self):
+        """The dereferenced ProcessParameters of the PEB
+
+        :type: :class:`~windows.generated_def.winstructs.RTL_USER_PROCESS_PARAMETERS`
+		"""
+        return self.ProcessParameters.contents
+
+    @utils.fixedpropety
     def imagepath(self):
         """The ImagePathName of the PEB
 
         :type: :class:`~windows.generated_def.winstructs.LSA_UNICODE_STRING`
 		"""
-        return self.ProcessParameters.contents.ImagePathName
+        return self.process_parameters.ImagePathName
 
-    @property
+    @utils.fixedpropety
     def commandline(self):
         """The CommandLine of the PEB
 
         :type: :class:`~windows.generated_def.winstructs.LSA_UNICODE_STRING`
 		"""
-        return self.ProcessParameters.contents.CommandLine
+        return self.process_parameters.CommandLine
+
+    def iter_modules(self):
+        """Yield the loaded modules in memory order: lets lookups stop at
+        the first match without materializing the whole list
+        (:data:`modules` is ``list(self.iter_modules())``)
+
+        :yield: :class:`LoadedModule`
+		"""
+        # Thread raw integers through the walk: ctypes.cast built a full
+        # LIST_ENTRY_PTR object per node just to read Flink, where a
+        # c_size_t.from_address on the link field gives the same integer.
+        # LoadedModule shares LDR_DATA_TABLE_ENTRY's layout, so build the
+        # final type directly instead of re-mapping each entry afterwards.
+        offset = _LDR_ENTRY_OFFSET
+        links_offset = _INMEMLINKS_OFFSET
+        ldr_data = self.Ldr.contents
+        flink = ctypes.c_size_t.from_address(addressof(ldr_data) + PEB_LDR_DATA.InMemoryOrderModuleList.offset).value
+        current_dll = LoadedModule.from_address(flink - offset)
+        while current_dll.DllBase:
+            yield current_dll
+            flink = ctypes.c_size_t.from_address(addressof(current_dll) + links_offset).value
+            current_dll = LoadedModule.from_address(flink - offset)
 
     @property
     def modules(self):
@@ -1226,14 +1561,114 @@ class PEB(gdef.PEB):
 
         :type: [:class:`LoadedModule`] -- List of loaded modules
 		"""
-        res = []
-        list_entry_ptr = ctypes.cast(self.Ldr.contents.InMemoryOrderModuleList.Flink, LIST_ENTRY_PTR)
-        current_dll = list_entry_ptr.TO_LDR_ENTRY()
-        while current_dll.DllBase:
-            res.append(current_dll)
-            list_entry_ptr = ctypes.cast(current_dll.InMemoryOrderLinks.Flink, LIST_ENTRY_PTR)
-            current_dll = list_entry_ptr.TO_LDR_ENTRY()
-        return [LoadedModule.from_address(addressof(LDR)) for LDR in res]
+        # Preallocate from the previous walk's size (module counts are
+        # stable between walks) so the list grows at most once instead of
+        # reallocating geometrically under append
+        # 'or' and not a dict default: a zero hint (empty previous walk)
+        # could never double back up from len 0
+        res = [None] * (self.__dict__.get("_last_module_count") or 128)
+        i = 0
+        size = len(res)
+        for module in self.iter_modules():
+            if i == size:
+                res.extend([None] * size)
+                size *= 2
+            res[i] = module
+            i += 1
+        self._last_module_count = i
+        del res[i:]
+        return res
+
+    # Index caches: repeated "find this dll" lookups re-walked the whole
+    # Ldr list otherwise. Cached via fixedpropety; the walk itself stays
+    # uncached so invalidation only drops the indexes.
+    @utils.fixedpropety
+    def modules_by_name(self):
+        """The loaded modules indexed by lowercase name (first occurence
+        wins, matching a walk of the load order). Cached on first access:
+        call :func:`invalidate_modules_cache` after (un)loading a DLL.
+
+        :type: {:class:`str`: :class:`LoadedModule`}
+		"""
+        res = {}
+        for module in self.modules:
+            res.setdefault(module.name, module)
+        return res
+
+    @utils.fixedpropety
+    def modules_by_base(self):
+        """The loaded modules indexed by base address. Cached on first
+        access: call :func:`invalidate_modules_cache` after (un)loading a DLL.
+
+        :type: {:class:`int`: :class:`LoadedModule`}
+		"""
+        return dict((module.baseaddr, module) for module in self.modules)
+
+    @utils.fixedpropety
+    def modules_snapshot(self):
+        """A :class:`ModuleSnapshot` of the loaded modules: contiguous
+        base/size arrays (sorted by base address) instead of a list of
+        ctypes views, so bulk range queries scan flat memory and
+        :func:`module_containing` can binary-search. Cached on first
+        access: call :func:`invalidate_modules_cache` after (un)loading
+        a DLL.
+
+        :type: :class:`ModuleSnapshot`
+		"""
+        entries = sorted((m.DllBase, m.SizeOfImage, m.name) for m in self.modules)
+        bases = []
+        sizes = array.array("L")
+        names = []
+        for base, size, name in entries:
+            bases.append(base)
+            sizes.append(size)
+            names.append(name)
+        return ModuleSnapshot(bases, sizes, names)
+
+    def module_containing(self, addr):
+        """The name of the loaded module whose image range contains
+        ``addr``, or ``None``
+
+        :rtype: :class:`str` or ``None``
+		"""
+        snap = self.modules_snapshot
+        i = bisect.bisect_right(snap.bases, addr) - 1
+        if i >= 0 and addr - snap.bases[i] < snap.sizes[i]:
+            return snap.names[i]
+        return None
+
+    def _ldr_list_probe(self):
+        # The raw Flink/Blink words of InMemoryOrderModuleList: they change
+        # whenever a module is (un)loaded at either end of the list, which
+        # is where the loader links new entries
+        ldr_data = self.Ldr.contents
+        return ctypes.string_at(addressof(ldr_data) + _INMEM_LIST_OFFSET, _LDR_ENTRY_OFFSET)
+
+    @property
+    def modules_cached(self):
+        """The loaded modules, re-walked only when the InMemoryOrder list
+        head looks different from the last walk. The probe misses an
+        (un)load that touches neither end of the list: use
+        :data:`modules` (always fresh) or :func:`invalidate_modules_cache`
+        when exactness matters.
+
+        :type: [:class:`LoadedModule`] -- List of loaded modules
+		"""
+        probe = self._ldr_list_probe()
+        cached = self.__dict__.get("_modules_cache")
+        if cached is not None and cached[0] == probe:
+            return cached[1]
+        modules = self.modules
+        self._modules_cache = (probe, modules)
+        return modules
+
+    def invalidate_modules_cache(self):
+        """Drop the cached :data:`modules_by_name` / :data:`modules_by_base` /
+        :data:`modules_snapshot` / :data:`modules_cached` indexes"""
+        self.__dict__.pop("_modules_by_name", None)
+        self.__dict__.pop("_modules_by_base", None)
+        self.__dict__.pop("_modules_snapshot", None)
+        self.__dict__.pop("_modules_cache", None)
 
     @staticmethod
     def _extract_environment(env_block_addr, target):
@@ -1249,7 +1684,7 @@ class PEB(gdef.PEB):
     @property
     def environment(self):
         # TODO: Tests
-        return self._extract_environment(self.ProcessParameters.contents.Environment, windows.current_process)
+        return self._extract_environment(self.process_parameters.Environment, windows.current_process)
 
     @property
     def apisetmap(self):
@@ -1338,7 +1773,7 @@ class RemoteLoadedModule(rctypes.RemoteStructure.from_structure(LoadedModule)):
 
 class RemotePEB(rctypes.RemoteStructure.from_structure(PEB)):
     def ptr_flink_to_remote_module(self, ptr_value):
-        return RemoteLoadedModule(ptr_value - ctypes.sizeof(ctypes.c_void_p) * 2, self._target)
+        return RemoteLoadedModule(ptr_value - _LDR_ENTRY_OFFSET, self._target)
 
     @property
     def exe(self):
@@ -1348,22 +1783,35 @@ class RemotePEB(rctypes.RemoteStructure.from_structure(PEB)):
         """
         return pe_parse.GetPEFile(self.ImageBaseAddress, target=self._target)
 
+    def iter_modules(self):
+        """Yield the loaded modules in memory order: lets lookups stop at
+        the first match and skip the remote reads for the remaining entries
+
+        :yield: :class:`RemoteLoadedModule`
+		"""
+        return _iter_remote_ldr(self, RemoteLoadedModule, _LDR_ENTRY_OFFSET, _PTR_NATIVE, _INMEM_LIST_OFFSET)
+
+    def _ldr_list_probe(self):
+        return self._target.read_memory(self.Ldr.raw_value + _INMEM_LIST_OFFSET, _LDR_ENTRY_OFFSET)
+
+    # modules is inherited from PEB: it consumes self.iter_modules()
+
+    # Uncached on purpose: the remote process can rewrite its PEB at any time
     @property
-    def modules(self):
-        """The loaded modules present in the PEB
+    def imagepath(self):
+        """The ImagePathName of the PEB
 
-        :type: [:class:`LoadedModule`] -- List of loaded modules
+        :type: :class:`~windows.generated_def.winstructs.LSA_UNICODE_STRING`
 		"""
-        res = []
-        if not self.Ldr.value:
-                raise ValueError("PEB->Ldr is NULL: cannot walk the module list")
-        list_entry_ptr = self.Ldr.contents.InMemoryOrderModuleList.Flink.raw_value
-        current_dll = self.ptr_flink_to_remote_module(list_entry_ptr)
-        while current_dll.DllBase:
-            res.append(current_dll)
-            list_entry_ptr = current_dll.InMemoryOrderLinks.Flink.raw_value
-            current_dll = self.ptr_flink_to_remote_module(list_entry_ptr)
-        return res
+        return self.ProcessParameters.contents.ImagePathName
+
+    @property
+    def commandline(self):
+        """The CommandLine of the PEB
+
+        :type: :class:`~windows.generated_def.winstructs.LSA_UNICODE_STRING`
+		"""
+        return self.ProcessParameters.contents.CommandLine
 
     @property
     def environment(self):
@@ -1378,6 +1826,8 @@ class RemotePEB(rctypes.RemoteStructure.from_structure(PEB)):
 
 
 if CurrentProcess().bitness == 32:
+    _INMEM_LIST_OFFSET64 = rctypes.transform_type_to_remote64bits(PEB_LDR_DATA).InMemoryOrderModuleList.offset
+
     class RemoteLoadedModule64(rctypes.transform_type_to_remote64bits(LoadedModule)):
         @property
         def pe(self):
@@ -1390,7 +1840,7 @@ if CurrentProcess().bitness == 32:
     class RemotePEB64(rctypes.transform_type_to_remote64bits(PEB)):
 
         def ptr_flink_to_remote_module(self, ptr_value):
-            return RemoteLoadedModule64(ptr_value - ctypes.sizeof(rctypes.c_void_p64) * 2, self._target)
+            return RemoteLoadedModule64(ptr_value - _LDR_ENTRY_OFFSET64, self._target)
 
 
         @property
@@ -1401,31 +1851,30 @@ if CurrentProcess().bitness == 32:
             """
             return pe_parse.GetPEFile(self.ImageBaseAddress, target=self._target)
 
-        @property
-        def modules(self):
-            """The loaded modules present in the PEB
+        def iter_modules(self):
+            """Yield the loaded modules in memory order: lets lookups stop at
+            the first match and skip the remote reads for the remaining entries
 
-            :type: [:class:`LoadedModule`] -- List of loaded modules
+            :yield: :class:`RemoteLoadedModule64`
 			"""
-            res = []
-            if not self.Ldr.value:
-                raise ValueError("PEB->Ldr is NULL: cannot walk the module list")
-            list_entry_ptr = self.Ldr.contents.InMemoryOrderModuleList.Flink.raw_value
-            current_dll = self.ptr_flink_to_remote_module(list_entry_ptr)
-            while current_dll.DllBase:
-                res.append(current_dll)
-                list_entry_ptr = current_dll.InMemoryOrderLinks.Flink.raw_value
-                current_dll = self.ptr_flink_to_remote_module(list_entry_ptr)
-            return res
+            return _iter_remote_ldr(self, RemoteLoadedModule64, _LDR_ENTRY_OFFSET64, _PTR64, _INMEM_LIST_OFFSET64)
+
+        def _ldr_list_probe(self):
+            return self._target.read_memory(self.Ldr.raw_value + _INMEM_LIST_OFFSET64, _LDR_ENTRY_OFFSET64)
+
+        # modules is inherited from PEB: it consumes self.iter_modules()
 
         @property
         def environment(self):
             # TODO: Tests
             return self._extract_environment(self.ProcessParameters.contents.Environment, self._target)
 
+        imagepath = RemotePEB.imagepath
+        commandline = RemotePEB.commandline
         apisetmap = RemotePEB.apisetmap
 
 if CurrentProcess().bitness == 64:
+    _INMEM_LIST_OFFSET32 = rctypes.transform_type_to_remote32bits(PEB_LDR_DATA).InMemoryOrderModuleList.offset
 
     class RemoteLoadedModule32(rctypes.transform_type_to_remote32bits(LoadedModule)):
         @property
@@ -1438,7 +1887,7 @@ if CurrentProcess().bitness == 64:
 
     class RemotePEB32(rctypes.transform_type_to_remote32bits(PEB)):
         def ptr_flink_to_remote_module(self, ptr_value):
-            return RemoteLoadedModule32(ptr_value - ctypes.sizeof(rctypes.c_void_p32) * 2, self._target)
+            return RemoteLoadedModule32(ptr_value - _LDR_ENTRY_OFFSET32, self._target)
 
         @property
         def exe(self):
@@ -1449,26 +1898,24 @@ if CurrentProcess().bitness == 64:
             return pe_parse.GetPEFile(self.ImageBaseAddress, target=self._target)
 
 
-        @property
-        def modules(self):
-            """The loaded modules present in the PEB
+        def iter_modules(self):
+            """Yield the loaded modules in memory order: lets lookups stop at
+            the first match and skip the remote reads for the remaining entries
 
-            :type: [:class:`LoadedModule`] -- List of loaded modules
+            :yield: :class:`RemoteLoadedModule32`
 			"""
-            res = []
-            if not self.Ldr.value:
-                raise ValueError("PEB->Ldr is NULL: cannot walk the module list")
-            list_entry_ptr = self.Ldr.contents.InMemoryOrderModuleList.Flink.raw_value
-            current_dll = self.ptr_flink_to_remote_module(list_entry_ptr)
-            while current_dll.DllBase:
-                res.append(current_dll)
-                list_entry_ptr = current_dll.InMemoryOrderLinks.Flink.raw_value
-                current_dll = self.ptr_flink_to_remote_module(list_entry_ptr)
-            return res
+            return _iter_remote_ldr(self, RemoteLoadedModule32, _LDR_ENTRY_OFFSET32, _PTR32, _INMEM_LIST_OFFSET32)
+
+        def _ldr_list_probe(self):
+            return self._target.read_memory(self.Ldr.raw_value + _INMEM_LIST_OFFSET32, _LDR_ENTRY_OFFSET32)
+
+        # modules is inherited from PEB: it consumes self.iter_modules()
 
         @property
         def environment(self):
             # TODO: Tests
             return self._extract_environment(self.ProcessParameters.contents.Environment, self._target)
 
+        imagepath = RemotePEB.imagepath
+        commandline = RemotePEB.commandline
         apisetmap = RemotePEB.apisetmap
\ No newline at end of file
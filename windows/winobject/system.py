@@ -1,4 +1,5 @@
 import os
+import array
 import ctypes
 import copy
 import struct
@@ -50,6 +51,42 @@ class System(object):
 		"""
         return self.enumerate_threads_setup_owners()
 
+    @property
+    def processes_by_pid(self):
+        """The running processes indexed by pid, from a single snapshot.
+
+        Build this dict once when resolving many pids (each lookup is then a
+        dict access instead of a traversal of :data:`processes`)
+
+        :type: {:class:`int`: :class:`~windows.winobject.process.WinProcess`}
+		"""
+        return {proc.pid: proc for proc in self.enumerate_processes()}
+
+    @property
+    def pids(self):
+        """The pids of the running processes, from a single snapshot, as a
+        compact :class:`array.array` of unsigned ints.
+
+        For "is this pid alive" / "list all pids" style queries this avoids
+        building one :class:`~windows.winobject.process.WinProcess` per entry
+        and scans a contiguous buffer instead of a list of objects.
+
+        :type: :class:`array.array`
+		"""
+        dbgprint("Enumerating pids with CreateToolhelp32Snapshot", "SLOW")
+        process_entry = PROCESSENTRY32()
+        process_entry.dwSize = ctypes.sizeof(process_entry)
+        snap = winproxy.CreateToolhelp32Snapshot(gdef.TH32CS_SNAPPROCESS, 0)
+        next_entry = winproxy.Process32Next
+        res = array.array("L")
+        append_pid = res.append
+        winproxy.Process32First(snap, process_entry)
+        append_pid(process_entry.th32ProcessID)
+        while next_entry(snap, process_entry):
+            append_pid(process_entry.th32ProcessID)
+        winproxy.CloseHandle(snap)
+        return res
+
     @property
     def logicaldrives(self):
         """List of logical drives [C:\, ...]
@@ -375,10 +412,15 @@ class System(object):
         process_entry.dwSize = ctypes.sizeof(process_entry)
         snap = winproxy.CreateToolhelp32Snapshot(gdef.TH32CS_SNAPPROCESS, 0)
         winproxy.Process32First(snap, process_entry)
+        # Hoist the per-iteration attribute lookups out of the loop: with
+        # hundreds of entries the winproxy/classmethod resolution adds up
+        next_entry = winproxy.Process32Next
+        from_entry = process.WinProcess._from_PROCESSENTRY32
         res = []
-        res.append(process.WinProcess._from_PROCESSENTRY32(process_entry))
-        while winproxy.Process32Next(snap, process_entry):
-            res.append(process.WinProcess._from_PROCESSENTRY32(process_entry))
+        append_proc = res.append
+        append_proc(from_entry(process_entry))
+        while next_entry(snap, process_entry):
+            append_proc(from_entry(process_entry))
         winproxy.CloseHandle(snap)
         return res
 
@@ -428,12 +470,16 @@ class System(object):
 
         thread_entry = THREADENTRY32()
         thread_entry.dwSize = ctypes.sizeof(thread_entry)
+        # Same hoisting as enumerate_processes: threads are the biggest
+        # Toolhelp enumeration (thousands of entries on a loaded system)
+        next_entry = winproxy.Thread32Next
+        from_entry = process.WinThread._from_THREADENTRY32
+        get_proc = proc_dict.__getitem__
         threads = []
+        append_thread = threads.append
         winproxy.Thread32First(snap, thread_entry)
-        parent = proc_dict[thread_entry.th32OwnerProcessID]
-        threads.append(process.WinThread._from_THREADENTRY32(thread_entry, owner=parent))
-        while winproxy.Thread32Next(snap, thread_entry):
-            parent = proc_dict[thread_entry.th32OwnerProcessID]
-            threads.append(process.WinThread._from_THREADENTRY32(thread_entry, owner=parent))
+        append_thread(from_entry(thread_entry, owner=get_proc(thread_entry.th32OwnerProcessID)))
+        while next_entry(snap, thread_entry):
+            append_thread(from_entry(thread_entry, owner=get_proc(thread_entry.th32OwnerProcessID)))
         winproxy.CloseHandle(snap)
         return threads
\ No newline at end of file
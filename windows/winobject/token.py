@@ -454,8 +454,13 @@ class Token(utils.AutoHandle):
         :type: :class:`int`
 		"""
         sid = self.integrity_level.Sid
-        count = winproxy.GetSidSubAuthorityCount(sid)
-        integrity = winproxy.GetSidSubAuthority(sid, count[0] - 1)[0]
+        # The SID layout is fixed (Revision, SubAuthorityCount,
+        # IdentifierAuthority[6], SubAuthority[SubAuthorityCount]): read the
+        # count and last subauthority in place rather than paying two
+        # GetSidSubAuthority* API round-trips per query
+        sid_addr = sid.value
+        count = gdef.BYTE.from_address(sid_addr + 1).value
+        integrity = gdef.DWORD.from_address(sid_addr + 8 + (count - 1) * 4).value
         return KNOW_INTEGRITY_LEVEL[integrity]
 
     def set_integrity(self, integrity):